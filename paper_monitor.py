@@ -5,26 +5,70 @@ Monitors new papers in SFM, SLAM, 3DGS, and NeRF research areas
 Supports Slack notifications and GitHub deployment
 """
 
-import json
+import asyncio
+import hashlib
+import html
 import os
 import sys
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 import logging
 
 # Third-party imports
+import aiohttp
+import aiosmtplib
 import arxiv
 import feedparser
-import smtplib
+import orjson
 import requests
+from dulwich import porcelain
+from dulwich.client import get_transport_and_path
+from dulwich.objects import Blob, Commit, Tree
+from dulwich.repo import Repo
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+# Identity used for GitHub Pages commits
+PAGES_COMMITTER = b"Paper Monitor Bot <bot@example.com>"
+
+# HTML card for a single paper in the web report; fields must be HTML-escaped
+PAPER_TMPL = """
+                    <div class="paper">
+                        <div class="paper-title">{title}</div>
+                        <div class="paper-meta">
+                            <strong>Authors:</strong> {authors}<br>
+                            <strong>Published:</strong> {published}<br>
+                            <strong>Categories:</strong> {categories}<br>
+                            <strong>URL:</strong> <a href="{pdf_url}" target="_blank">View Paper</a>
+                        </div>
+                        <div class="paper-summary">{summary}</div>
+                    </div>
+                    """
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# The arXiv API returns at most 2000 results per request
+ARXIV_MAX_PAGE_SIZE = 2000
+
+# Searches rejected with these statuses are retried with exponential backoff.
+# This is the only retry layer (clients are built with num_retries=0), so a
+# search sends at most SEARCH_ATTEMPTS requests per page.
+RETRYABLE_HTTP_STATUSES = {403, 429, 500, 502, 503, 504}
+SEARCH_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 10
+
+# arXiv publishes new listings once a day: cached queries and a quiet-run site last this long
+ONE_DAY_SECONDS = 24 * 60 * 60
+
+# Number of seen paper IDs kept to prevent unbounded growth
+MAX_TRACKED_PAPER_IDS = 1000
+
 class PaperMonitor:
     """
     A class to monitor new academic papers in computer vision research fields
@@ -33,9 +77,15 @@ class PaperMonitor:
     def __init__(self, config_file: str = "config.json"):
         """Initialize the paper monitor with configuration"""
         self.config = self.load_config(config_file)
-        self.client = arxiv.Client()
+        self._set_run_time()
+        self._local = threading.local()
+        self.max_workers = 4
         self.data_file = "papers_data.json"
+        self.cache_dir = "cache"
+        self.cache_ttl = ONE_DAY_SECONDS
         self.previous_papers = self.load_previous_papers()
+        self._seen_ids = set(self.previous_papers["paper_ids"])
+        self._papers_data = None
 
         # Research field search queries
         self.search_queries = {
@@ -44,6 +94,13 @@ class PaperMonitor:
             "3DGS": ["3D Gaussian Splatting", "3DGS", "Gaussian splatting", "neural splatting"],
             "NeRF": ["Neural Radiance Fields", "NeRF", "neural rendering", "novel view synthesis"]
         }
+        self.client = self._new_client()
+        self._cat_clause = "cat:" + " OR cat:".join(self.config['monitoring']['categories'])
+
+    def _set_run_time(self):
+        """Capture the timestamps shared by everything produced in one run"""
+        self._now = datetime.now()
+        self._utcnow = datetime.now(timezone.utc)
 
     def load_config(self, config_file: str) -> Dict[str, Any]:
         """Load configuration from JSON file"""
@@ -77,8 +134,8 @@ class PaperMonitor:
         }
 
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            with open(config_file, 'rb') as f:
+                config = orjson.loads(f.read())
             # Merge with defaults
             for key in default_config:
                 if key not in config:
@@ -88,53 +145,215 @@ class PaperMonitor:
             logger.warning(f"Config file {config_file} not found, using defaults")
             return default_config
 
-    def load_previous_papers(self) -> Dict[str, List[str]]:
+    def load_previous_papers(self) -> Dict[str, Any]:
         """Load previously seen papers from JSON file"""
         try:
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
+            with open(self.data_file, 'rb') as f:
+                previous_papers = orjson.loads(f.read())
         except FileNotFoundError:
-            return {"paper_ids": [], "last_check": ""}
+            previous_papers = {"paper_ids": [], "last_check": ""}
+
+        # Bounded FIFO: the oldest IDs fall off as new ones are appended
+        previous_papers["paper_ids"] = deque(previous_papers.get("paper_ids", []), maxlen=MAX_TRACKED_PAPER_IDS)
+        return previous_papers
 
     def save_papers_data(self, papers_data: Dict[str, Any]):
         """Save papers data to JSON file"""
-        with open(self.data_file, 'w') as f:
-            json.dump(papers_data, f, indent=2)
+        # Machine-only state, so skip pretty-printing
+        with open(self.data_file, 'wb') as f:
+            f.write(orjson.dumps(papers_data))
+
+    def _field_max_results(self, field: str) -> int:
+        """Number of results requested by a field's batched query"""
+        max_results = self.config['monitoring']['max_results_per_query'] * len(self.search_queries.get(field, []))
+        return min(max_results, ARXIV_MAX_PAGE_SIZE)
+
+    def _new_client(self) -> arxiv.Client:
+        """Create an arXiv client whose page size covers a whole field query"""
+        largest_query = max(self._field_max_results(field) for field in self.search_queries)
+        return arxiv.Client(page_size=max(100, largest_query), delay_seconds=3, num_retries=0)
+
+    def _get_client(self) -> arxiv.Client:
+        """Return the arXiv client owned by the current worker thread"""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._new_client()
+            self._local.client = client
+        return client
+
+    @staticmethod
+    def _result_to_dict(paper: arxiv.Result) -> Dict[str, Any]:
+        """Serialize an arXiv result for the query cache"""
+        return {
+            "entry_id": paper.entry_id,
+            "title": paper.title,
+            "authors": [author.name for author in paper.authors],
+            "summary": paper.summary,
+            "published": paper.published.isoformat(),
+            "pdf_url": paper.pdf_url,
+            "categories": paper.categories
+        }
+
+    @staticmethod
+    def _result_from_dict(data: Dict[str, Any]) -> arxiv.Result:
+        """Rebuild an arXiv result from its cached form"""
+        links = [arxiv.Result.Link(data["pdf_url"], title="pdf")] if data["pdf_url"] else []
+        return arxiv.Result(
+            entry_id=data["entry_id"],
+            published=datetime.fromisoformat(data["published"]),
+            title=data["title"],
+            authors=[arxiv.Result.Author(name) for name in data["authors"]],
+            summary=data["summary"],
+            categories=data["categories"],
+            links=links
+        )
+
+    def _cache_path(self, search: arxiv.Search) -> str:
+        """Return the cache file for a search, keyed on the query, limits and date"""
+        monitoring = self.config['monitoring']
+        key_parts = [
+            search.query,
+            str(search.max_results),
+            str(monitoring['days_back']),
+            str(monitoring['max_results_per_query']),
+            self._now.strftime('%Y-%m-%d')
+        ]
+        key = hashlib.sha1("|".join(key_parts).encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load_cached_results(self, path: str) -> Optional[List[arxiv.Result]]:
+        """Load cached results, deleting the file if it has expired"""
+        try:
+            with open(path, 'rb') as f:
+                cached = orjson.loads(f.read())
+            if time.time() - cached["ts"] >= self.cache_ttl:
+                os.remove(path)
+                return None
+            return [self._result_from_dict(data) for data in cached["results"]]
+        except FileNotFoundError:
+            return None
+        except (ValueError, OSError, KeyError, TypeError) as e:
+            # Drop the bad file so the next call fetches fresh results
+            logger.warning(f"Discarding unreadable cache file {path}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def _save_cached_results(self, path: str, results: List[arxiv.Result]):
+        """Write search results to the cache"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps({"ts": time.time(), "results": [self._result_to_dict(paper) for paper in results]}))
+
+    def prune_cache(self):
+        """Delete cache files older than the cache TTL"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        cutoff = time.time() - self.cache_ttl
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+
+    @staticmethod
+    def _unique_results(papers: Iterable[arxiv.Result]) -> Iterator[arxiv.Result]:
+        """Yield each paper once; several query terms often match the same paper"""
+        seen = set()
+        for paper in papers:
+            if paper.entry_id not in seen:
+                seen.add(paper.entry_id)
+                yield paper
+
+    def fetch_results(self, search: arxiv.Search) -> List[arxiv.Result]:
+        """Fetch search results, serving them from the disk cache when fresh"""
+        path = self._cache_path(search)
+        cached = self._load_cached_results(path)
+        if cached is not None:
+            logger.info(f"Using cached results for query: {search.query}")
+            return cached
+
+        # Consume the generator lazily: once a paper falls outside the date
+        # window the remaining pages are never requested. Rate limiting is
+        # handled by the client's delay_seconds.
+        results = self.filter_recent_papers(self._unique_results(self._get_client().results(search)))
+        self._save_cached_results(path, results)
+        return results
+
+    def _fetch_with_backoff(self, search: arxiv.Search) -> List[arxiv.Result]:
+        """Fetch results, backing off exponentially while arXiv is throttling or failing"""
+        for attempt in range(SEARCH_ATTEMPTS):
+            try:
+                return self.fetch_results(search)
+            except (arxiv.HTTPError, arxiv.UnexpectedEmptyPageError, requests.exceptions.ConnectionError) as e:
+                if isinstance(e, arxiv.HTTPError) and e.status not in RETRYABLE_HTTP_STATUSES:
+                    raise
+                if attempt == SEARCH_ATTEMPTS - 1:
+                    raise
+                delay = BACKOFF_BASE_SECONDS * 2 ** attempt
+                logger.warning(f"arXiv request failed ({e}), retrying in {delay}s")
+                time.sleep(delay)
 
     def search_papers_by_field(self, field: str) -> List[arxiv.Result]:
-        """Search for papers in a specific research field"""
+        """Search for papers in a specific research field with a single batched query"""
         queries = self.search_queries.get(field, [])
-        all_papers = []
+        if not queries:
+            return []
+
+        # OR all query terms together and restrict to the monitored categories
+        terms = " OR ".join(f'all:"{term}"' for term in queries)
+        search_query = f"({terms}) AND ({self._cat_clause})"
+
+        # Let arXiv drop papers outside the monitoring window. Whole days keep
+        # the query (and so its cache key) stable for the rest of the day.
+        now = self._utcnow
+        start = (now - timedelta(days=self.config['monitoring']['days_back'])).strftime('%Y%m%d0000')
+        end = now.strftime('%Y%m%d2359')
+        search_query += f" AND submittedDate:[{start} TO {end}]"
+
+        search = arxiv.Search(
+            query=search_query,
+            max_results=self._field_max_results(field),
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Descending
+        )
 
-        for query_term in queries:
-            # Create search with category filter and recent papers
-            search_query = f"({query_term}) AND cat:{' OR cat:'.join(self.config['monitoring']['categories'])}"
+        try:
+            results = self._fetch_with_backoff(search)
+        except arxiv.HTTPError as e:
+            logger.error(f"arXiv returned HTTP {e.status} searching for {field} papers")
+            return []
+        except arxiv.UnexpectedEmptyPageError as e:
+            logger.error(f"arXiv returned an unexpected empty page searching for {field} papers: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error searching for {field} papers: {e}")
+            return []
 
-            search = arxiv.Search(
-                query=search_query,
-                max_results=self.config['monitoring']['max_results_per_query'],
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending
-            )
+        logger.info(f"Found {len(results)} papers for {field}")
+        return results
 
-            try:
-                results = list(self.client.results(search))
-                all_papers.extend(results)
-                logger.info(f"Found {len(results)} papers for {field} query: {query_term}")
-                time.sleep(1)  # Rate limiting
-            except Exception as e:
-                logger.error(f"Error searching for {query_term}: {e}")
-
-        return all_papers
-
-    def filter_recent_papers(self, papers: List[arxiv.Result]) -> List[arxiv.Result]:
-        """Filter papers to only include recent ones"""
-        cutoff_date = datetime.now() - timedelta(days=self.config['monitoring']['days_back'])
+    def search_all_fields(self) -> Dict[str, List[arxiv.Result]]:
+        """Search every research field concurrently"""
+        fields = list(self.search_queries)
+        self.prune_cache()
+
+        logger.info(f"Searching {len(fields)} fields with {self.max_workers} workers...")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(fields, executor.map(self.search_papers_by_field, fields)))
+
+    def filter_recent_papers(self, papers: Iterable[arxiv.Result]) -> List[arxiv.Result]:
+        """Filter papers to only include recent ones (the query's date range is whole days)"""
+        # arxiv.py returns timezone-aware UTC datetimes, so compare against an aware cutoff
+        cutoff_date = self._utcnow - timedelta(days=self.config['monitoring']['days_back'])
         recent_papers = []
 
+        # Papers are sorted newest first, so everything after the first old one is old too
         for paper in papers:
-            if paper.published.replace(tzinfo=None) > cutoff_date:
-                recent_papers.append(paper)
+            if paper.published <= cutoff_date:
+                break
+            recent_papers.append(paper)
 
         return recent_papers
 
@@ -143,15 +362,16 @@ class PaperMonitor:
         new_papers_by_field = {}
         all_new_paper_ids = []
 
-        for field in self.search_queries.keys():
-            logger.info(f"Searching for {field} papers...")
-            papers = self.search_papers_by_field(field)
+        papers_by_field = self.search_all_fields()
+
+        for field, papers in papers_by_field.items():
+            # Cached results were filtered against an earlier cutoff
             recent_papers = self.filter_recent_papers(papers)
 
             # Filter out papers we've already seen
             new_papers = []
             for paper in recent_papers:
-                if paper.entry_id not in self.previous_papers.get("paper_ids", []):
+                if paper.entry_id not in self._seen_ids:
                     new_papers.append({
                         "id": paper.entry_id,
                         "title": paper.title,
@@ -163,102 +383,109 @@ class PaperMonitor:
                         "field": field
                     })
                     all_new_paper_ids.append(paper.entry_id)
+                    self._seen_ids.add(paper.entry_id)
 
             new_papers_by_field[field] = new_papers
             logger.info(f"Found {len(new_papers)} new {field} papers")
 
-        # Update our records
-        current_paper_ids = self.previous_papers.get("paper_ids", [])
+        # Update our records; the deque keeps only the most recent IDs
+        current_paper_ids = self.previous_papers["paper_ids"]
         current_paper_ids.extend(all_new_paper_ids)
 
-        # Keep only recent papers to prevent unbounded growth
         papers_data = {
-            "paper_ids": current_paper_ids[-1000:],  # Keep last 1000 paper IDs
-            "last_check": datetime.now().isoformat(),
+            "paper_ids": list(current_paper_ids),
+            "last_check": self._now.isoformat(),
+            "last_deploy": self.previous_papers.get("last_deploy", ""),
             "new_papers": new_papers_by_field
         }
 
         self.save_papers_data(papers_data)
+        self._papers_data = papers_data
         return new_papers_by_field
 
-    def generate_report(self, new_papers: Dict[str, List[Dict[str, Any]]]) -> str:
+    def generate_report(self, active_fields: List[Tuple[str, List[Dict[str, Any]]]], total_papers: int,
+                        now: datetime) -> str:
         """Generate a text report of new papers"""
-        total_papers = sum(len(papers) for papers in new_papers.values())
-
         if total_papers == 0:
             return "No new papers found in the monitored research fields."
 
-        report = f"# New Papers Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        report += f"Found {total_papers} new papers across all research fields.\n\n"
-
-        for field, papers in new_papers.items():
-            if papers:
-                report += f"## {field} ({len(papers)} papers)\n\n"
-                for paper in papers:
-                    report += f"**{paper['title']}**\n"
-                    report += f"Authors: {', '.join(paper['authors'][:3])}{'...' if len(paper['authors']) > 3 else ''}\n"
-                    report += f"Published: {paper['published'][:10]}\n"
-                    report += f"Categories: {', '.join(paper['categories'])}\n"
-                    report += f"URL: {paper['pdf_url']}\n"
-                    report += f"Summary: {paper['summary']}\n\n"
-                report += "---\n\n"
-
-        return report
-
-    def send_email_notification(self, report: str):
+        parts = [
+            f"# New Papers Report - {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            f"Found {total_papers} new papers across all research fields.\n\n"
+        ]
+
+        for field, papers in active_fields:
+            parts.append(f"## {field} ({len(papers)} papers)\n\n")
+            for paper in papers:
+                parts.append(f"**{paper['title']}**\n")
+                parts.append(f"Authors: {', '.join(paper['authors'][:3])}{'...' if len(paper['authors']) > 3 else ''}\n")
+                parts.append(f"Published: {paper['published'][:10]}\n")
+                parts.append(f"Categories: {', '.join(paper['categories'])}\n")
+                parts.append(f"URL: {paper['pdf_url']}\n")
+                parts.append(f"Summary: {paper['summary']}\n\n")
+            parts.append("---\n\n")
+
+        return "".join(parts)
+
+    async def send_email_notification(self, report: str):
         """Send email notification with new papers"""
         if not self.config["email"]["enabled"]:
             logger.info("Email notifications are disabled")
             return
 
+        recipients = self.config["email"]["recipient_emails"]
+        if not recipients:
+            logger.warning("Email notifications are enabled but no recipients are configured")
+            return
+
         try:
             msg = MIMEMultipart()
             msg['From'] = self.config["email"]["sender_email"]
-            msg['Subject'] = f"New Academic Papers - {datetime.now().strftime('%Y-%m-%d')}"
+            msg['To'] = ", ".join(recipients)
+            msg['Subject'] = f"New Academic Papers - {self._now.strftime('%Y-%m-%d')}"
 
             msg.attach(MIMEText(report, 'plain'))
 
-            server = smtplib.SMTP(self.config["email"]["smtp_server"], self.config["email"]["smtp_port"])
-            server.starttls()
-            server.login(self.config["email"]["sender_email"], self.config["email"]["sender_password"])
+            server = aiosmtplib.SMTP(
+                hostname=self.config["email"]["smtp_server"],
+                port=self.config["email"]["smtp_port"],
+                start_tls=True
+            )
+            await server.connect()
+            await server.login(self.config["email"]["sender_email"], self.config["email"]["sender_password"])
 
-            for recipient in self.config["email"]["recipient_emails"]:
-                msg['To'] = recipient
-                server.send_message(msg)
-                logger.info(f"Email sent to {recipient}")
+            await server.send_message(msg, recipients=recipients)
+            logger.info(f"Email sent to {', '.join(recipients)}")
 
-            server.quit()
+            await server.quit()
 
         except Exception as e:
             logger.error(f"Error sending email: {e}")
 
-    def send_slack_notification(self, new_papers: Dict[str, List[Dict[str, Any]]]):
+    async def send_slack_notification(self, active_fields: List[Tuple[str, List[Dict[str, Any]]]], total_papers: int):
         """Send Slack notification with new papers"""
         if not self.config["slack"]["enabled"]:
             logger.info("Slack notifications are disabled")
             return
 
-        total_papers = sum(len(papers) for papers in new_papers.values())
-        
         if total_papers == 0:
             message = "📚 No new papers found in the monitored research fields."
         else:
             message = f"📚 Found {total_papers} new papers!\n\n"
             
-            for field, papers in new_papers.items():
-                if papers:
-                    message += f"*{field}* ({len(papers)} papers):\n"
-                    for paper in papers[:3]:  # Limit to 3 papers per field to avoid message length issues
-                        authors_text = ', '.join(paper['authors'][:2])
-                        if len(paper['authors']) > 2:
-                            authors_text += f" and {len(paper['authors']) - 2} others"
-                        
-                        message += f"• <{paper['pdf_url']}|{paper['title']}>\n"
-                        message += f"  _by {authors_text}_\n"
+            for field, papers in active_fields:
+                message += f"*{field}* ({len(papers)} papers):\n"
+                for paper in papers[:3]:  # Limit to 3 papers per field to avoid message length issues
+                    authors_text = ', '.join(paper['authors'][:2])
+                    if len(paper['authors']) > 2:
+                        authors_text += f" and {len(paper['authors']) - 2} others"
                     
-                    if len(papers) > 3:
-                        message += f"  _... and {len(papers) - 3} more papers_\n"
-                    message += "\n"
+                    message += f"• <{paper['pdf_url']}|{paper['title']}>\n"
+                    message += f"  _by {authors_text}_\n"
+                
+                if len(papers) > 3:
+                    message += f"  _... and {len(papers) - 3} more papers_\n"
+                message += "\n"
 
         payload = {
             "channel": self.config["slack"]["channel"],
@@ -268,21 +495,34 @@ class PaperMonitor:
         }
 
         try:
-            response = requests.post(
-                self.config["slack"]["webhook_url"],
-                json=payload,
-                timeout=10
-            )
-            response.raise_for_status()
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.post(self.config["slack"]["webhook_url"], json=payload) as response:
+                    response.raise_for_status()
             logger.info("Slack notification sent successfully")
         except Exception as e:
             logger.error(f"Error sending Slack notification: {e}")
 
-    def generate_web_report(self, new_papers: Dict[str, List[Dict[str, Any]]]):
-        """Generate HTML report for web deployment"""
-        total_papers = sum(len(papers) for papers in new_papers.values())
+    @staticmethod
+    def _escape_paper(paper: Dict[str, Any]) -> Dict[str, str]:
+        """HTML-escape the fields of a paper used by PAPER_TMPL"""
+        authors_text = ', '.join(paper['authors'][:3])
+        if len(paper['authors']) > 3:
+            authors_text += f" and {len(paper['authors']) - 3} others"
+
+        return {
+            "title": html.escape(paper['title']),
+            "authors": html.escape(authors_text),
+            "published": html.escape(paper['published'][:10]),
+            "categories": html.escape(', '.join(paper['categories'])),
+            "pdf_url": html.escape(paper['pdf_url'] or ""),
+            "summary": html.escape(paper['summary'])
+        }
 
-        html_content = f"""
+    def generate_web_report(self, active_fields: List[Tuple[str, List[Dict[str, Any]]]], total_papers: int,
+                            now: datetime):
+        """Generate HTML report for web deployment"""
+        parts = [f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -306,107 +546,182 @@ class PaperMonitor:
         <h1>Academic Paper Monitor</h1>
         <p>Monitoring new papers in: Structure from Motion (SFM), SLAM, 3D Gaussian Splatting (3DGS), and Neural Radiance Fields (NeRF)</p>
         <p><strong>Total new papers found:</strong> {total_papers}</p>
-        <p class="last-updated">Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
+        <p class="last-updated">Last updated: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
     </div>
-"""
+"""]
 
         if total_papers == 0:
-            html_content += "<p><em>No new papers found in the monitored research fields.</em></p>"
+            parts.append("<p><em>No new papers found in the monitored research fields.</em></p>")
         else:
-            for field, papers in new_papers.items():
-                if papers:
-                    html_content += f'<div class="field-section"><h2 class="field-title">{field} ({len(papers)} papers)</h2>'
-                    for paper in papers:
-                        authors_text = ', '.join(paper['authors'][:3])
-                        if len(paper['authors']) > 3:
-                            authors_text += f" and {len(paper['authors']) - 3} others"
-
-                        html_content += f"""
-                        <div class="paper">
-                            <div class="paper-title">{paper['title']}</div>
-                            <div class="paper-meta">
-                                <strong>Authors:</strong> {authors_text}<br>
-                                <strong>Published:</strong> {paper['published'][:10]}<br>
-                                <strong>Categories:</strong> {', '.join(paper['categories'])}<br>
-                                <strong>URL:</strong> <a href="{paper['pdf_url']}" target="_blank">View Paper</a>
-                            </div>
-                            <div class="paper-summary">{paper['summary']}</div>
-                        </div>
-                        """
-                    html_content += "</div>"
+            for field, papers in active_fields:
+                parts.append(f'<div class="field-section"><h2 class="field-title">{html.escape(field)} ({len(papers)} papers)</h2>')
+                parts.extend(PAPER_TMPL.format_map(self._escape_paper(paper)) for paper in papers)
+                parts.append("</div>")
 
-        html_content += "</body></html>"
+        parts.append("</body></html>")
+        html_content = "".join(parts)
 
         # Save HTML report
         with open("index.html", "w", encoding="utf-8") as f:
             f.write(html_content)
         logger.info("Generated HTML report: index.html")
 
-    def deploy_to_github_pages(self):
-        """Deploy the HTML report to GitHub Pages"""
+    async def deploy_to_github_pages(self):
+        """Deploy the HTML report to GitHub Pages; raises if the enabled deployment fails"""
         if not self.config["github"]["enabled"]:
             logger.info("GitHub deployment is disabled")
             return
 
+        github = self.config["github"]
+        message = f"Update paper monitor report - {self._now.strftime('%Y-%m-%d %H:%M:%S')}"
+        credentials = {"username": "x-access-token", "password": github["token"]} if github["token"] else {}
+
         try:
-            # Create a simple deployment script
-            deploy_script = f"""#!/bin/bash
-# Deploy to GitHub Pages
-git config --global user.name "Paper Monitor Bot"
-git config --global user.email "bot@example.com"
-
-# Add the HTML file
-git add index.html
-git commit -m "Update paper monitor report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-
-# Push to GitHub Pages branch
-git push origin {self.config['github']['branch']}:{self.config['github']['pages_branch']}
-"""
-            
-            with open("deploy.sh", "w") as f:
-                f.write(deploy_script)
-            
-            # Make the script executable
-            os.chmod("deploy.sh", 0o755)
-            
-            logger.info("GitHub Pages deployment script created: deploy.sh")
-            logger.info("Run './deploy.sh' to deploy to GitHub Pages")
-            
+            # dulwich is blocking, so keep it off the event loop
+            await asyncio.to_thread(publish_to_pages, ["index.html"], github["pages_branch"], message, **credentials)
         except Exception as e:
-            logger.error(f"Error creating GitHub deployment script: {e}")
+            logger.error(f"Error deploying to GitHub Pages: {e}")
+            raise
+        logger.info(f"Deployed index.html to the {github['pages_branch']} branch")
+        self._record_deploy()
+
+    def _record_deploy(self):
+        """Remember when GitHub Pages was last deployed successfully"""
+        papers_data = self._papers_data
+        if papers_data is None:
+            # Deployed without checking for papers first
+            papers_data = dict(self.previous_papers, paper_ids=list(self.previous_papers["paper_ids"]))
+        papers_data["last_deploy"] = self._utcnow.isoformat()
+        self.previous_papers["last_deploy"] = papers_data["last_deploy"]
+        self.save_papers_data(papers_data)
+
+    def _deploy_is_fresh(self) -> bool:
+        """Whether GitHub Pages was successfully deployed within the last day"""
+        try:
+            last_deploy = datetime.fromisoformat(self.previous_papers.get("last_deploy", ""))
+        except (TypeError, ValueError):
+            return False
+        return (self._utcnow - last_deploy).total_seconds() < ONE_DAY_SECONDS
+
+    def _site_is_fresh(self) -> bool:
+        """Whether index.html was regenerated within the last day"""
+        try:
+            return time.time() - os.path.getmtime("index.html") < ONE_DAY_SECONDS
+        except OSError:
+            return False
+
+    async def _notify_all(self, text_report: str, active_fields: List[Tuple[str, List[Dict[str, Any]]]],
+                          total_papers: int, deploy: bool = True):
+        """Send notifications and, if requested, deploy concurrently; re-raises a failed deployment"""
+        tasks = [
+            self.send_email_notification(text_report),
+            self.send_slack_notification(active_fields, total_papers)
+        ]
+        if deploy:
+            tasks.append(self.deploy_to_github_pages())
+        # Let every task finish before surfacing a failure
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                raise result
 
     def run(self):
         """Main execution method"""
         logger.info("Starting paper monitoring...")
+        self._set_run_time()
         new_papers = self.check_for_new_papers()
+        active_fields = [(field, papers) for field, papers in new_papers.items() if papers]
+        total_papers = sum(map(len, new_papers.values()))
 
         # Generate reports
-        text_report = self.generate_report(new_papers)
+        text_report = self.generate_report(active_fields, total_papers, self._now)
         logger.info("Generated text report")
 
         # Save text report
         with open("report.txt", "w", encoding="utf-8") as f:
             f.write(text_report)
 
-        # Generate web report
-        self.generate_web_report(new_papers)
-
-        # Send notifications
-        self.send_email_notification(text_report)
-        self.send_slack_notification(new_papers)
+        # Nothing new: keep a recent index.html, and only redeploy if the last
+        # successful deployment is more than a day old
+        regenerate_site = total_papers > 0 or not self._site_is_fresh()
+        deploy_site = regenerate_site or not self._deploy_is_fresh()
+        if regenerate_site:
+            self.generate_web_report(active_fields, total_papers, self._utcnow)
+        else:
+            logger.info("No new papers and index.html is up to date, skipping web report")
+        if not deploy_site:
+            logger.info("No new papers and GitHub Pages was deployed within the last day, skipping deployment")
 
-        # Deploy to GitHub Pages if enabled
-        self.deploy_to_github_pages()
+        # Send notifications and deploy to GitHub Pages if enabled
+        asyncio.run(self._notify_all(text_report, active_fields, total_papers, deploy=deploy_site))
 
-        total_papers = sum(len(papers) for papers in new_papers.values())
         logger.info(f"Monitoring complete. Found {total_papers} new papers.")
 
         return new_papers
 
+def publish_to_pages(files: List[str], pages_branch: str, message: str, remote: str = "origin",
+                     repo_path: str = ".", **push_kwargs) -> bytes:
+    """
+    Commit files as the sole contents of the pages branch and push it.
+    The commit builds on the remote's pages branch, so its history is kept. It is pushed
+    straight from the object store and only recorded under refs/remotes/, so local
+    branches, including a checked-out pages branch, and the working tree are untouched.
+    """
+    repo = Repo.discover(repo_path)
+    try:
+        ref = f"refs/heads/{pages_branch}".encode()
+        remote_name, remote_url = porcelain.get_remote_repo(repo, remote)
+        client, path = get_transport_and_path(remote_url, config=repo.get_config_stack(), **push_kwargs)
+
+        # Fetch only the remote pages branch head (fresh clones never have it locally)
+        def determine_wants(refs, depth=None):
+            return [refs[ref]] if ref in refs and refs[ref] not in repo.object_store else []
+
+        remote_refs = client.fetch(path, repo, determine_wants=determine_wants).refs
+        parents = [remote_refs[ref]] if ref in remote_refs else []
+
+        tree = Tree()
+        for path_name in files:
+            with open(path_name, "rb") as f:
+                blob = Blob.from_string(f.read())
+            repo.object_store.add_object(blob)
+            tree.add(os.path.basename(path_name).encode(), 0o100644, blob.id)
+        repo.object_store.add_object(tree)
+
+        commit = Commit()
+        commit.tree = tree.id
+        commit.parents = parents
+        commit.author = commit.committer = PAGES_COMMITTER
+        commit.author_time = commit.commit_time = int(time.time())
+        commit.author_timezone = commit.commit_timezone = 0
+        commit.encoding = b"UTF-8"
+        commit.message = message.encode()
+        repo.object_store.add_object(commit)
+
+        # A fast-forward of the remote branch, so no force push is needed
+        def update_refs(refs):
+            if refs.get(ref) != (parents[0] if parents else None):
+                raise RuntimeError(f"Remote {pages_branch} branch moved during deployment")
+            return {ref: commit.id}
+
+        result = client.send_pack(path, update_refs, generate_pack_data=repo.generate_pack_data)
+        error = (result.ref_status or {}).get(ref)
+        if error:
+            raise RuntimeError(f"Push of {pages_branch} was rejected: {error}")
+
+        if remote_name:
+            repo.refs[f"refs/remotes/{remote_name}/{pages_branch}".encode()] = commit.id
+        return commit.id
+    finally:
+        repo.close()
+
 def main():
     """Main function for command line execution"""
     monitor = PaperMonitor()
-    monitor.run()
+    try:
+        monitor.run()
+    except Exception as e:
+        logger.error(f"Paper monitoring failed: {e}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
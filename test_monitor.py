@@ -4,9 +4,26 @@ Test script for the Academic Paper Monitor
 """
 
 import json
+import os
 import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
 import arxiv
-from paper_monitor import PaperMonitor
+from dulwich import porcelain
+from dulwich.repo import Repo
+from paper_monitor import PAPER_TMPL, PaperMonitor, publish_to_pages
+
+def make_result(entry_id, published, title="A title"):
+    """Build an arXiv result without hitting the API"""
+    return arxiv.Result(
+        entry_id=entry_id,
+        published=published,
+        title=title,
+        authors=[arxiv.Result.Author("Ada Lovelace"), arxiv.Result.Author("Alan Turing")],
+        summary="A summary",
+        categories=["cs.CV"],
+        links=[arxiv.Result.Link(f"{entry_id}.pdf", title="pdf")]
+    )
 
 def test_config_loading():
     """Test configuration loading"""
@@ -47,6 +64,163 @@ def test_arxiv_connection():
         print(f"❌ arXiv API connection failed: {e}")
         return False
 
+def test_cache_round_trip():
+    """Test that cached arXiv results survive serialization and bad cache files are dropped"""
+    print("\nTesting query cache...")
+    try:
+        monitor = PaperMonitor()
+        paper = make_result("http://arxiv.org/abs/1234.5678v1", datetime.now(timezone.utc))
+
+        restored = monitor._result_from_dict(monitor._result_to_dict(paper))
+        fields = ["entry_id", "title", "summary", "published", "pdf_url", "categories"]
+        if any(getattr(restored, name) != getattr(paper, name) for name in fields):
+            print("❌ Cached result does not match the original")
+            return False
+        if [author.name for author in restored.authors] != [author.name for author in paper.authors]:
+            print("❌ Cached authors do not match the original")
+            return False
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            monitor.cache_dir = cache_dir
+            path = os.path.join(cache_dir, "query.json")
+            monitor._save_cached_results(path, [paper])
+            cached = monitor._load_cached_results(path)
+            if not cached or cached[0].entry_id != paper.entry_id:
+                print("❌ Cached results could not be read back")
+                return False
+
+            with open(path, "w") as f:
+                f.write('{"foo": 1}')
+            if monitor._load_cached_results(path) is not None or os.path.exists(path):
+                print("❌ Malformed cache file was not discarded")
+                return False
+
+        print("✅ Query cache round-trips results and discards bad files")
+        return True
+    except Exception as e:
+        print(f"❌ Query cache test failed: {e}")
+        return False
+
+def test_filter_recent_papers():
+    """Test that date filtering stops reading at the first old paper"""
+    print("\nTesting date filtering...")
+    try:
+        monitor = PaperMonitor()
+        now = datetime.now(timezone.utc)
+        days_back = monitor.config['monitoring']['days_back']
+        papers = [
+            make_result("new", now),
+            make_result("recent", now - timedelta(days=days_back - 1)),
+            make_result("old", now - timedelta(days=days_back + 1)),
+            make_result("older", now - timedelta(days=days_back + 2))
+        ]
+
+        consumed = []
+        def stream():
+            for paper in papers:
+                consumed.append(paper.entry_id)
+                yield paper
+
+        recent = monitor.filter_recent_papers(stream())
+        if [paper.entry_id for paper in recent] != ["new", "recent"]:
+            print(f"❌ Unexpected filtered papers: {[paper.entry_id for paper in recent]}")
+            return False
+        if "older" in consumed:
+            print("❌ Filtering kept reading after the first old paper")
+            return False
+
+        print("✅ Date filtering stops at the first old paper")
+        return True
+    except Exception as e:
+        print(f"❌ Date filtering test failed: {e}")
+        return False
+
+def test_unique_results():
+    """Test that repeated entry IDs are dropped from a result stream"""
+    print("\nTesting result deduplication...")
+    try:
+        now = datetime.now(timezone.utc)
+        papers = [make_result(entry_id, now) for entry_id in ["a", "a", "b", "a", "c", "b"]]
+
+        unique = [paper.entry_id for paper in PaperMonitor._unique_results(iter(papers))]
+        if unique != ["a", "b", "c"]:
+            print(f"❌ Unexpected deduplicated papers: {unique}")
+            return False
+
+        print("✅ Repeated papers are dropped in order")
+        return True
+    except Exception as e:
+        print(f"❌ Result deduplication test failed: {e}")
+        return False
+
+def test_html_escaping():
+    """Test that paper fields are HTML-escaped in the web report"""
+    print("\nTesting HTML escaping...")
+    try:
+        paper = {
+            "title": "<script>alert(1)</script> & more",
+            "authors": ["A <b>", "B", "C", "D"],
+            "summary": "x < y & y > z",
+            "published": "2024-01-01T00:00:00+00:00",
+            "pdf_url": 'http://arxiv.org/pdf/1"onload="x',
+            "categories": ["cs.CV"]
+        }
+        card = PAPER_TMPL.format_map(PaperMonitor._escape_paper(paper))
+        expected = [
+            "&lt;script&gt;alert(1)&lt;/script&gt; &amp; more",
+            "A &lt;b&gt;, B, C and 1 others",
+            "x &lt; y &amp; y &gt; z",
+            'href="http://arxiv.org/pdf/1&quot;onload=&quot;x"'
+        ]
+        if "<script>" in card or any(text not in card for text in expected):
+            print("❌ Paper card contains unescaped fields")
+            return False
+
+        print("✅ Paper fields are HTML-escaped")
+        return True
+    except Exception as e:
+        print(f"❌ HTML escaping test failed: {e}")
+        return False
+
+def test_publish_to_pages():
+    """Test that Pages deploys build on the remote branch history"""
+    print("\nTesting GitHub Pages publishing...")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            remote_path = os.path.join(tmp, "remote.git")
+            Repo.init_bare(remote_path, mkdir=True).close()
+
+            # Two clones that never had the pages branch locally
+            commit_ids = []
+            for name in ["first", "second"]:
+                work_path = os.path.join(tmp, name)
+                with Repo.init(work_path, mkdir=True) as work:
+                    porcelain.remote_add(work, "origin", remote_path)
+                index_path = os.path.join(work_path, "index.html")
+                with open(index_path, "w") as f:
+                    f.write(f"<html>{name}</html>")
+                commit_ids.append(publish_to_pages([index_path], "gh-pages", f"Deploy {name}", repo_path=work_path))
+                with Repo(work_path) as work:
+                    if b"refs/heads/gh-pages" in work.refs:
+                        print("❌ Deploy wrote a local gh-pages branch")
+                        return False
+
+            with Repo(remote_path) as remote:
+                head = remote[remote.refs[b"refs/heads/gh-pages"]]
+                files = [entry.path for entry in remote[head.tree].items()]
+                if head.id != commit_ids[1] or head.parents != [commit_ids[0]]:
+                    print("❌ Deploy did not build on the remote gh-pages history")
+                    return False
+                if files != [b"index.html"]:
+                    print(f"❌ Unexpected gh-pages contents: {files}")
+                    return False
+
+        print("✅ Pages deploys keep the remote branch history")
+        return True
+    except Exception as e:
+        print(f"❌ GitHub Pages publishing test failed: {e}")
+        return False
+
 def test_slack_config():
     """Test Slack configuration"""
     print("\nTesting Slack configuration...")
@@ -95,6 +269,11 @@ def main():
     tests = [
         test_config_loading,
         test_arxiv_connection,
+        test_cache_round_trip,
+        test_filter_recent_papers,
+        test_unique_results,
+        test_html_escaping,
+        test_publish_to_pages,
         test_slack_config,
         test_github_config
     ]